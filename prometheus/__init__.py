@@ -12,9 +12,33 @@ and robust error handling for production-grade PDF processing.
 __version__ = "0.2.0"  # Bumped for professional improvements
 __author__ = "Terry"
 
+# config is bound eagerly: it shares its name with the submodule, and a lazy
+# lookup would be shadowed once any other module imports prometheus.config.
 from .config import config
-from .logging_setup import get_logger, setup_logging
-from .pdf_utils import PDFError
-from .server import app, main
+
+# The remaining exports resolve on first access (PEP 562) so importing the
+# package does not pull in fitz, tiktoken and fastmcp up front.
+_LAZY_EXPORTS = {
+    "PDFError": ".pdf_utils",
+    "app": ".server",
+    "get_logger": ".logging_setup",
+    "main": ".server",
+    "setup_logging": ".logging_setup",
+}
 
 __all__ = ["PDFError", "app", "config", "get_logger", "main", "setup_logging"]
+
+
+def __getattr__(name: str) -> object:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY_EXPORTS])
@@ -9,7 +9,7 @@ import os
 from pathlib import Path
 
 from dotenv import load_dotenv
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 # Load environment variables from .env file if it exists
 load_dotenv()
@@ -18,6 +18,9 @@ load_dotenv()
 class PrometheusConfig(BaseModel):
     """Configuration settings for Prometheus MCP server."""
 
+    # Settings are read on every request and never reassigned after startup
+    model_config = ConfigDict(frozen=True)
+
     # Logging configuration
     log_level: str = Field(
         default=os.getenv("PROMETHEUS_LOG_LEVEL", "INFO"),
@@ -51,6 +54,22 @@ class PrometheusConfig(BaseModel):
         default=int(os.getenv("PROMETHEUS_TIMEOUT", "300")),
         description="Processing timeout in seconds"
     )
+    mupdf_store_shrink_percent: int = Field(
+        default=int(os.getenv("PROMETHEUS_MUPDF_STORE_SHRINK", "100")),
+        description="Percent of MuPDF's object cache to free after each document (0 disables)"
+    )
+
+    # Tokenizer settings
+    tiktoken_cache_dir: str = Field(
+        default=os.getenv(
+            "PROMETHEUS_TIKTOKEN_CACHE_DIR",
+            str(Path.home() / ".cache" / "prometheus" / "tiktoken"),
+        ),
+        description=(
+            "Directory where tiktoken keeps its downloaded BPE vocabulary; empty "
+            "disables caching. Ignored if TIKTOKEN_CACHE_DIR or DATA_GYM_CACHE_DIR is set"
+        )
+    )
 
     # Output settings
     default_output_dir: str | None = Field(
@@ -6,46 +6,185 @@ These functions are used both by the MCP server and the CLI.
 """
 
 import asyncio
+import atexit
+import copy
+import hashlib
+import json
+import multiprocessing
+import os
 import re
-from collections.abc import Iterator
+import threading
+from collections import OrderedDict, deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import fitz  # PyMuPDF
-import tiktoken
 
 from .config import config
-from .logging_setup import get_logger
+from .logging_setup import get_logger, setup_logging
+
+if TYPE_CHECKING:
+    import tiktoken
 
-# Global encoder for token counting
-encoder = tiktoken.get_encoding("cl100k_base")
 logger = get_logger(__name__)
 
+# Token count cache: short texts are keyed directly, longer ones by digest so
+# the cache doesn't pin whole pages of text in memory.
+_TOKEN_CACHE_SIZE = 4096
+_TOKEN_CACHE_MAX_KEY_CHARS = 1024
+_token_cache: OrderedDict[str | bytes, int] = OrderedDict()
+_token_cache_lock = threading.Lock()
+# tiktoken releases the GIL while encoding, so batches scale across cores
+_TOKENIZER_THREADS = os.cpu_count() or 1
+
+# get_pdf_info results keyed by (absolute path, mtime_ns, size)
+_INFO_CACHE_SIZE = 128
+_info_cache: OrderedDict[tuple[str, int, int], dict] = OrderedDict()
+_info_cache_lock = threading.Lock()
+
+# Text cleaning patterns. Passes that never overlap share one alternation
+# and dispatch on match.lastgroup; the whitespace and sentence branches only
+# match where the replacement actually changes something.
+_RE_MULTI_NL = re.compile(r'\n\s*\n\s*\n+')
+_RE_SPACING = re.compile(r'(?P<nl>\n\s*\n\s*\n+)|(?P<ws>(?: [ \t]|\t)[ \t]*)')
+_RE_PAGENUM = re.compile(r'\n\d+\n')
+_RE_PUNCT = re.compile(
+    r'(?P<bullet>\u2022\s*)|(?P<stop>[.!?])(?! [A-Z])\s*(?P<cap>[A-Z])'
+)
+# Fast-path detectors: does a pass above have anything to change?
+_RE_CTRL = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\xff]')
+_RE_SENT_UNSPACED = re.compile(r'[.!?](?! [A-Z])\s*[A-Z]')
+# Control characters (and the 0x7f-0xff range) are deleted via str.translate
+_CTRL_TABLE = dict.fromkeys(
+    [*range(0, 9), 11, 12, *range(14, 32), *range(127, 256)], None
+)
+
+# PyMuPDF does not support concurrent use from several threads, and the public
+# coroutines below run their work in worker threads. All MuPDF calls, and the
+# open-document cache, are serialized on this lock.
+_mupdf_lock = threading.RLock()
+
+# Open source documents keyed by absolute path, so consecutive tool calls on
+# the same file (info -> extract -> split) parse its xref and page tree once.
+# Each entry records the (mtime_ns, size) the document was opened at.
+_DOC_CACHE_SIZE = 8
+_doc_cache: OrderedDict[str, tuple[tuple[int, int], fitz.Document]] = OrderedDict()
+
+# Plain-text extraction keeps the default clipping to the page and the
+# fallback for glyphs without a Unicode mapping (otherwise they come out as
+# U+FFFD); ligature and whitespace preservation is wasted work since
+# clean_extracted_text normalizes whitespace anyway.
+_TEXT_FLAGS = fitz.TEXT_MEDIABOX_CLIP | fitz.TEXT_CID_FOR_UNKNOWN_UNICODE
+# Text extraction works through the document this many pages at a time, so
+# streamed extraction never holds the whole document's text
+_EXTRACT_WINDOW_PAGES = 64
+
+# Large splits write chunks in separate processes: PyMuPDF documents can't be
+# shared across threads, and saving (compression) is CPU-bound. forkserver
+# avoids forking a multi-threaded server process while keeping worker startup
+# cheap; spawn is the fallback where it isn't available.
+_MAX_SPLIT_WORKERS = min(8, os.cpu_count() or 1)
+_PARALLEL_SPLIT_MIN_MB = 20
+_SPLIT_MP_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+# Shared across split_pdf calls so workers (and the source documents they keep
+# open) are reused instead of paying process startup on every split.
+_split_pool: ProcessPoolExecutor | None = None
+_split_pool_lock = threading.Lock()
+
+# Output PDFs are compressed and deduplicated; this costs a little CPU but
+# shrinks what we write to disk considerably. Content streams are copied as-is
+# ("clean" would re-tokenize every page and dominates save time).
+_SAVE_OPTIONS = {
+    "garbage": 3,
+    "deflate": True,
+    "deflate_images": True,
+    "deflate_fonts": True,
+}
+
 
 class PDFError(Exception):
     """Custom exception for PDF processing errors."""
     pass
 
 
+def _acquire_document(pdf_path: str) -> fitz.Document:
+    """Return the cached document for pdf_path with _mupdf_lock held.
+
+    The document is reopened when the file's mtime or size has changed. The
+    cache owns the document: callers release the lock but never close it.
+    """
+    _mupdf_lock.acquire()
+    try:
+        path = os.path.abspath(pdf_path)
+        stat = os.stat(path)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        entry = _doc_cache.get(path)
+        if entry is not None and entry[0] == stamp:
+            _doc_cache.move_to_end(path)
+            return entry[1]
+
+        if entry is not None:
+            del _doc_cache[path]
+            entry[1].close()
+        doc = fitz.open(path, filetype="pdf")
+        _doc_cache[path] = (stamp, doc)
+        while len(_doc_cache) > _DOC_CACHE_SIZE:
+            _doc_cache.popitem(last=False)[1][1].close()
+        return doc
+    except BaseException:
+        _mupdf_lock.release()
+        raise
+
+
 @contextmanager
-def safe_pdf_context(pdf_path: str) -> Iterator[fitz.Document]:
-    """Context manager for safe PDF operations with proper cleanup."""
-    doc = None
+def _cached_document(pdf_path: str) -> Iterator[fitz.Document]:
+    """Use the cached open document for pdf_path for the duration of the block."""
+    doc = _acquire_document(pdf_path)
     try:
-        # Validate file exists and size
-        path = Path(pdf_path)
-        if not path.exists():
-            raise PDFError(f"PDF file not found: {pdf_path}")
+        yield doc
+    finally:
+        _mupdf_lock.release()
+
+
+@atexit.register
+def _close_cached_documents() -> None:
+    with _mupdf_lock:
+        for _, doc in _doc_cache.values():
+            doc.close()
+        _doc_cache.clear()
+
+
+@contextmanager
+def safe_pdf_context(pdf_path: str) -> Iterator[tuple[fitz.Document, float]]:
+    """Context manager for safe PDF operations with proper cleanup.
+
+    Yields the open document together with its file size in MB so callers
+    don't need to stat the file again.
+    """
+    acquired = False
+    try:
+        # Validate file exists and size with a single stat call
+        try:
+            file_size_mb = os.path.getsize(pdf_path) / (1 << 20)
+        except FileNotFoundError as e:
+            raise PDFError(f"PDF file not found: {pdf_path}") from e
 
-        file_size_mb = path.stat().st_size / (1024 * 1024)
         if file_size_mb > config.max_file_size_mb:
             raise PDFError(f"PDF file too large: {file_size_mb:.1f}MB (max: {config.max_file_size_mb}MB)")
 
         logger.info("Opening PDF", file_path=pdf_path, size_mb=file_size_mb)
 
-        # Open PDF with error handling
+        # Open PDF (or reuse the cached copy) with error handling
         try:
-            doc = fitz.open(pdf_path)
+            doc = _acquire_document(pdf_path)
+            acquired = True
         except Exception as e:
             if "password" in str(e).lower():
                 raise PDFError("PDF is password protected") from e
@@ -58,46 +197,247 @@ def safe_pdf_context(pdf_path: str) -> Iterator[fitz.Document]:
         if len(doc) == 0:
             raise PDFError("PDF has no pages")
 
-        yield doc
+        yield doc, file_size_mb
 
     finally:
-        if doc:
-            doc.close()
-            logger.debug("PDF closed successfully")
+        if acquired:
+            _mupdf_lock.release()
+        _release_mupdf_store()
+
+
+def _release_mupdf_store() -> None:
+    """Free MuPDF's cached objects so memory doesn't grow across requests."""
+    if config.mupdf_store_shrink_percent > 0:
+        with _mupdf_lock:
+            fitz.TOOLS.store_shrink(config.mupdf_store_shrink_percent)
+
+
+@lru_cache(maxsize=1)
+def _get_encoder() -> "tiktoken.Encoding":
+    """Load the cl100k_base encoder once per process.
+
+    tiktoken is imported here rather than at module level so splitting and
+    range extraction never pay for it. The BPE vocabulary is cached in
+    config.tiktoken_cache_dir (PROMETHEUS_TIKTOKEN_CACHE_DIR) so it is only
+    downloaded once; containers and CI can pre-populate that directory to
+    avoid the download entirely. tiktoken's own TIKTOKEN_CACHE_DIR and
+    DATA_GYM_CACHE_DIR take precedence when set, and an empty directory
+    disables caching, as it does for tiktoken.
+    """
+    import tiktoken
+
+    if "TIKTOKEN_CACHE_DIR" not in os.environ and "DATA_GYM_CACHE_DIR" not in os.environ:
+        if not config.tiktoken_cache_dir:
+            os.environ["TIKTOKEN_CACHE_DIR"] = ""
+        else:
+            cache_dir = Path(config.tiktoken_cache_dir).expanduser()
+            try:
+                cache_dir.mkdir(parents=True, exist_ok=True)
+            except OSError as e:
+                logger.warning("Cannot create tiktoken cache directory", path=str(cache_dir), error=str(e))
+            else:
+                os.environ["TIKTOKEN_CACHE_DIR"] = str(cache_dir)
+    return tiktoken.get_encoding("cl100k_base")
+
+
+def _token_cache_key(text: str) -> str | bytes:
+    if len(text) <= _TOKEN_CACHE_MAX_KEY_CHARS:
+        return text
+    return hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+
+def _get_cached_token_count(key: str | bytes) -> int | None:
+    with _token_cache_lock:
+        count = _token_cache.get(key)
+        if count is not None:
+            _token_cache.move_to_end(key)
+        return count
+
+
+def _store_token_count(key: str | bytes, count: int) -> None:
+    with _token_cache_lock:
+        _token_cache[key] = count
+        _token_cache.move_to_end(key)
+        if len(_token_cache) > _TOKEN_CACHE_SIZE:
+            _token_cache.popitem(last=False)
 
 
 def count_tokens(text: str) -> int:
-    """Count tokens in text using tiktoken with error handling."""
+    """Count tokens in text using tiktoken with caching and error handling.
+
+    Empty and whitespace-only text counts as zero tokens without touching the
+    encoder; such text is stripped from chunks anyway.
+    """
+    if not text or text.isspace():
+        return 0
+
+    key = _token_cache_key(text)
+    cached = _get_cached_token_count(key)
+    if cached is not None:
+        return cached
+
     try:
-        return len(encoder.encode(text))
+        # PDF text may contain "<|endoftext|>" literally; count it as text
+        # rather than scanning for (and rejecting) special tokens
+        count = len(_get_encoder().encode_ordinary(text))
     except Exception as e:
         logger.warning("Token counting failed", error=str(e))
         # Fallback to rough estimation
         return len(text) // 4
 
+    _store_token_count(key, count)
+    return count
+
+
+def count_tokens_batch(texts: list[str]) -> list[int]:
+    """Count tokens for several texts, encoding all cache misses in one batch call."""
+    # Blank pages count as zero without hashing or looking them up
+    keys: list[str | bytes | None] = [
+        None if not text or text.isspace() else _token_cache_key(text)
+        for text in texts
+    ]
+    cached = [0 if key is None else _get_cached_token_count(key) for key in keys]
+    missing = [i for i, count in enumerate(cached) if count is None]
+    # Misses start at 0 and are filled in below
+    counts = [count or 0 for count in cached]
+    if not missing:
+        return counts
+
+    try:
+        encoded = _get_encoder().encode_ordinary_batch(
+            [texts[i] for i in missing], num_threads=_TOKENIZER_THREADS
+        )
+    except Exception as e:
+        logger.warning("Batch token counting failed", error=str(e))
+        for i in missing:
+            counts[i] = len(texts[i]) // 4
+        return counts
+
+    for i, tokens in zip(missing, encoded, strict=True):
+        key = keys[i]
+        assert key is not None  # blank texts never miss the cache
+        counts[i] = len(tokens)
+        _store_token_count(key, counts[i])
+    return counts
+
+
+def _page_header(page_number: int) -> str:
+    return f"\n--- Page {page_number} ---\n"
+
+
+@lru_cache(maxsize=1)
+def _page_header_base_tokens() -> int:
+    """Tokens in a page header other than its page number.
+
+    cl100k splits the number off into pieces of at most three digits, each a
+    single token, so the header for page n costs this plus ceil(digits / 3).
+    """
+    return len(_get_encoder().encode_ordinary(_page_header(1))) - 1
+
+
+def _count_tokens_with_headers(bodies: list[str], first_page: int = 1) -> list[int]:
+    """Count tokens of each page body with its page header prepended.
+
+    bodies[0] is page first_page. The header only merges with what follows it
+    when the body starts with a newline (or is pure whitespace); every other
+    body is encoded on its own and the header is added arithmetically rather
+    than re-encoded per page.
+    """
+    try:
+        base = _page_header_base_tokens()
+    except Exception:
+        # No encoder: estimate the full text like count_tokens_batch would
+        return count_tokens_batch(
+            [_page_header(n) + body for n, body in enumerate(bodies, start=first_page)]
+        )
+
+    joined = [body[:1] in ("\r", "\n") or body.isspace() for body in bodies]
+    counts = count_tokens_batch([
+        _page_header(n) + body if join else body
+        for n, (body, join) in enumerate(zip(bodies, joined, strict=True), start=first_page)
+    ])
+    for i, join in enumerate(joined):
+        if not join:
+            counts[i] += base + -(-len(str(first_page + i)) // 3)
+    return counts
+
+
+def _needs_cleaning(text: str) -> bool:
+    """Cheap check for whether any cleaning pass would change the text."""
+    return (
+        "\t" in text
+        or "  " in text
+        or "\u2022" in text
+        or _RE_MULTI_NL.search(text) is not None
+        or _RE_PAGENUM.search(text) is not None
+        or _RE_CTRL.search(text) is not None
+        or _RE_SENT_UNSPACED.search(text) is not None
+    )
+
+
+def _replace_spacing(match: re.Match) -> str:
+    return "\n\n" if match.lastgroup == "nl" else " "
+
+
+def _replace_punct(match: re.Match) -> str:
+    if match.lastgroup == "bullet":
+        return "\u2022 "
+    return f"{match['stop']} {match['cap']}"
+
 
 def clean_extracted_text(text: str) -> str:
     """Clean extracted text for better readability with enhanced patterns."""
-    if not text:
+    # Blank pages (dividers, empty backs) clean to nothing; skip the passes
+    if not text or text.isspace():
         return ""
 
+    # Well-formed text skips the cleaning passes entirely
+    if not _needs_cleaning(text):
+        return text.strip()
+
     # Remove excessive whitespace
-    text = re.sub(r'\n\s*\n\s*\n+', '\n\n', text)
-    text = re.sub(r'[ \t]+', ' ', text)
+    text = _RE_SPACING.sub(_replace_spacing, text)
 
     # Remove standalone numbers that are likely page artifacts
-    text = re.sub(r'\n\d+\n', '\n', text)
+    text = _RE_PAGENUM.sub('\n', text)
 
     # Remove common PDF artifacts
-    text = re.sub(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\xff]', '', text)  # Control characters
-    text = re.sub(r'\u2022\s*', '• ', text)  # Normalize bullet points
+    text = text.translate(_CTRL_TABLE)  # Control characters
 
-    # Fix common spacing issues
-    text = re.sub(r'([.!?])\s*([A-Z])', r'\1 \2', text)  # Sentence spacing
+    # Normalize bullet points and fix sentence spacing
+    text = _RE_PUNCT.sub(_replace_punct, text)
 
     return text.strip()
 
 
+def _pack_chunks(
+    pages: Iterable[tuple[int, int]], max_tokens: int
+) -> Iterator[tuple[int, int]]:
+    """Greedily group consecutive pages into chunks of at most max_tokens.
+
+    Takes (token count, text length) per page and yields half-open
+    (start, end) page index ranges as soon as each chunk closes, so pages can
+    be produced lazily. A chunk is only closed once it holds some text, so a
+    single oversized page still becomes its own chunk, and a document with no
+    text at all yields no chunks.
+    """
+    start = 0
+    page_count = 0
+    current_tokens = 0
+    current_len = 0
+    for i, (tokens, length) in enumerate(pages):
+        if current_tokens + tokens > max_tokens and current_len:
+            yield start, i
+            start = i
+            current_tokens = 0
+            current_len = 0
+        current_tokens += tokens
+        current_len += length
+        page_count = i + 1
+    if current_len:
+        yield start, page_count
+
+
 async def process_with_timeout(coro, timeout_seconds: int | None = None):
     """Execute coroutine with configurable timeout."""
     timeout = timeout_seconds or config.chunk_processing_timeout
@@ -107,13 +447,41 @@ async def process_with_timeout(coro, timeout_seconds: int | None = None):
         raise PDFError(f"Processing timed out after {timeout} seconds") from e
 
 
-async def get_pdf_info(pdf_path: str) -> dict:
-    """Get metadata and basic information about a PDF file with enhanced analytics."""
+def _info_cache_key(pdf_path: str) -> tuple[str, int, int] | None:
     try:
-        with safe_pdf_context(pdf_path) as doc:
-            path = Path(pdf_path)
-            file_size_mb = path.stat().st_size / (1024 * 1024)
+        stat = os.stat(pdf_path)
+    except OSError:
+        return None
+    return (os.path.abspath(pdf_path), stat.st_mtime_ns, stat.st_size)
+
+
+def _get_cached_info(key: tuple[str, int, int]) -> dict | None:
+    with _info_cache_lock:
+        info = _info_cache.get(key)
+        if info is None:
+            return None
+        _info_cache.move_to_end(key)
+        return copy.deepcopy(info)
+
+
+def _store_info(key: tuple[str, int, int], info: dict) -> None:
+    with _info_cache_lock:
+        _info_cache[key] = copy.deepcopy(info)
+        _info_cache.move_to_end(key)
+        if len(_info_cache) > _INFO_CACHE_SIZE:
+            _info_cache.popitem(last=False)
+
+
+def _get_pdf_info_sync(pdf_path: str) -> dict:
+    """Blocking implementation of get_pdf_info."""
+    cache_key = _info_cache_key(pdf_path)
+    if cache_key is not None:
+        cached = _get_cached_info(cache_key)
+        if cached is not None:
+            return cached
 
+    try:
+        with safe_pdf_context(pdf_path) as (doc, file_size_mb):
             # PDF metadata with null checking
             metadata = doc.metadata or {}
             has_bookmarks = len(doc.get_toc()) > 0
@@ -141,13 +509,18 @@ async def get_pdf_info(pdf_path: str) -> dict:
                 recommended_chunk_size = 20
                 complexity = "medium"
 
-            # Sample a few pages to estimate content density
-            sample_pages = min(3, total_pages)
+            # Sample a few pages to estimate content density. Pages are taken from
+            # the middle of evenly sized sections so covers and TOCs don't dominate.
+            sample_pages = min(5, total_pages)
+            sample_indices = [
+                (2 * k + 1) * total_pages // (2 * sample_pages) for k in range(sample_pages)
+            ]
             sample_text_length = 0
 
-            for i in range(sample_pages):
+            for page_index in sample_indices:
                 try:
-                    page_text = doc[i].get_text()
+                    # Only the length matters here; use the same flags as extraction
+                    page_text = doc[page_index].get_text("text", flags=_TEXT_FLAGS)
                     sample_text_length += len(page_text)
                 except Exception:
                     continue
@@ -163,7 +536,7 @@ async def get_pdf_info(pdf_path: str) -> dict:
                 estimated_tokens=estimated_tokens
             )
 
-            return {
+            result = {
                 "status": "success",
                 "pdf_info": {
                     "total_pages": total_pages,
@@ -194,17 +567,80 @@ async def get_pdf_info(pdf_path: str) -> dict:
             "error": f"Failed to read PDF: {e!s}"
         }
 
+    if cache_key is not None:
+        _store_info(cache_key, result)
+    return result
 
-async def split_pdf(
+
+async def get_pdf_info(pdf_path: str) -> dict:
+    """Get metadata and basic information about a PDF file with enhanced analytics.
+
+    Successful results are cached by (path, mtime, size), so repeated calls on
+    an unchanged file skip reopening and re-sampling it.
+    """
+    return await asyncio.to_thread(_get_pdf_info_sync, pdf_path)
+
+
+def _copy_pages(doc: fitz.Document, start_page: int, end_page: int, chunk_file: str) -> None:
+    """Write pages [start_page, end_page) of doc to a new PDF at chunk_file."""
+    chunk_doc = fitz.open()
+    try:
+        # Copy the whole page range in one call
+        chunk_doc.insert_pdf(doc, from_page=start_page, to_page=end_page - 1)
+        chunk_doc.save(chunk_file, **_SAVE_OPTIONS)
+    finally:
+        chunk_doc.close()
+
+
+def _write_chunk(pdf_path: str, start_page: int, end_page: int, chunk_file: str) -> None:
+    """Process-pool worker for split_pdf: write one chunk from the source.
+
+    Each worker keeps the source open in its own document cache, so its xref
+    and page tree are parsed once across all the chunks it writes.
+    """
+    with _cached_document(pdf_path) as doc:
+        _copy_pages(doc, start_page, end_page, chunk_file)
+
+
+def _get_split_pool() -> ProcessPoolExecutor:
+    """Return the shared split worker pool, creating it on first use."""
+    global _split_pool
+    with _split_pool_lock:
+        if _split_pool is None:
+            # The preload list is process-wide, so only touch it once a split
+            # actually needs workers rather than at import
+            if _SPLIT_MP_CONTEXT.get_start_method() == "forkserver":
+                _SPLIT_MP_CONTEXT.set_forkserver_preload([__name__])
+            # Workers don't import .server, so configure their logging here
+            _split_pool = ProcessPoolExecutor(
+                max_workers=_MAX_SPLIT_WORKERS,
+                mp_context=_SPLIT_MP_CONTEXT,
+                initializer=setup_logging,
+            )
+        return _split_pool
+
+
+def _discard_split_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken pool so the next split starts fresh workers."""
+    global _split_pool
+    with _split_pool_lock:
+        if _split_pool is pool:
+            _split_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _split_pdf_sync(
     pdf_path: str,
     pages_per_chunk: int = 20,
     output_dir: str | None = None,
     prefix: str = "chunk"
 ) -> dict:
-    """Split a PDF into smaller PDF files preserving all visual content."""
+    """Blocking implementation of split_pdf."""
     try:
         source_path = Path(pdf_path)
-        if not source_path.exists():
+        try:
+            file_size_mb = os.path.getsize(pdf_path) / (1 << 20)
+        except FileNotFoundError:
             return {"status": "error", "error": f"PDF file not found: {pdf_path}"}
 
         # Determine output directory
@@ -216,44 +652,59 @@ async def split_pdf(
         out_dir.mkdir(exist_ok=True)
 
         # Open source PDF
-        doc = fitz.open(pdf_path)
-        total_pages = len(doc)
+        with _cached_document(pdf_path) as doc:
+            total_pages = len(doc)
 
         if total_pages == 0:
-            doc.close()
             return {"status": "error", "error": "PDF has no pages"}
 
-        chunks_created = []
-        chunk_count = 0
-
-        for start_page in range(0, total_pages, pages_per_chunk):
+        # Plan all chunks up front so they can be written independently
+        chunk_jobs = []
+        for chunk_count, start_page in enumerate(range(0, total_pages, pages_per_chunk), start=1):
             end_page = min(start_page + pages_per_chunk, total_pages)
-            chunk_count += 1
-
-            # Create new PDF for this chunk
-            chunk_doc = fitz.open()
-
-            # Copy pages to new PDF
-            for page_num in range(start_page, end_page):
-                chunk_doc.insert_pdf(doc, from_page=page_num, to_page=page_num)
-
-            # Save chunk PDF
             chunk_file = out_dir / f"{prefix}_{chunk_count:02d}_pages_{start_page + 1:03d}-{end_page:03d}.pdf"
-            chunk_doc.save(chunk_file)
-            chunk_doc.close()
+            chunk_jobs.append((start_page, end_page, chunk_file))
+
+        # Worker startup only pays off once there is enough data to compress
+        workers = min(_MAX_SPLIT_WORKERS, len(chunk_jobs))
+        if workers > 1 and file_size_mb >= _PARALLEL_SPLIT_MIN_MB:
+            # Each worker process opens its own copy of the source document
+            pool = _get_split_pool()
+            # Workers resolve relative paths against the forkserver's cwd,
+            # which need not be ours
+            source_abspath = os.path.abspath(pdf_path)
+            try:
+                futures = [
+                    pool.submit(
+                        _write_chunk, source_abspath, start_page, end_page,
+                        os.path.abspath(chunk_file)
+                    )
+                    for start_page, end_page, chunk_file in chunk_jobs
+                ]
+                for future in futures:
+                    future.result()
+            except BrokenProcessPool:
+                _discard_split_pool(pool)
+                raise
+        else:
+            with _cached_document(pdf_path) as doc:
+                for start_page, end_page, chunk_file in chunk_jobs:
+                    _copy_pages(doc, start_page, end_page, str(chunk_file))
+        _release_mupdf_store()
 
-            chunks_created.append({
+        chunks_created = [
+            {
                 "chunk_id": chunk_count,
                 "file_path": str(chunk_file),
                 "pages": f"{start_page + 1}-{end_page}",
                 "page_count": end_page - start_page
-            })
-
-        doc.close()
+            }
+            for chunk_count, (start_page, end_page, chunk_file) in enumerate(chunk_jobs, start=1)
+        ]
 
         return {
             "status": "success",
-            "message": f"Successfully split PDF into {chunk_count} chunks",
+            "message": f"Successfully split PDF into {len(chunks_created)} chunks",
             "source_pdf": str(source_path),
             "output_directory": str(out_dir),
             "chunks_created": len(chunks_created),
@@ -267,92 +718,132 @@ async def split_pdf(
         }
 
 
-async def extract_text_from_pdf(
+async def split_pdf(
     pdf_path: str,
-    max_tokens_per_chunk: int = 8000,
-    include_page_numbers: bool = True,
-    clean_text: bool = True
+    pages_per_chunk: int = 20,
+    output_dir: str | None = None,
+    prefix: str = "chunk"
 ) -> dict:
-    """Extract text from PDF in token-aware chunks for LLM consumption."""
-    try:
-        doc = fitz.open(pdf_path)
-        total_pages = len(doc)
-
-        chunks = []
-        current_chunk = ""
-        current_tokens = 0
-        chunk_id = 1
-        pages_in_chunk = []
+    """Split a PDF into smaller PDF files preserving all visual content."""
+    return await asyncio.to_thread(_split_pdf_sync, pdf_path, pages_per_chunk, output_dir, prefix)
+
+
+def _iter_page_windows(
+    pdf_path: str, total_pages: int, clean_text: bool, include_page_numbers: bool
+) -> Iterator[tuple[list[str], list[int]]]:
+    """Yield (page contents, token counts) for consecutive windows of pages.
+
+    Only one window of page text is alive at a time; the MuPDF lock is held
+    just for the get_text calls of each window.
+    """
+    for first in range(0, total_pages, _EXTRACT_WINDOW_PAGES):
+        last = min(first + _EXTRACT_WINDOW_PAGES, total_pages)
+        with _cached_document(pdf_path) as doc:
+            page_texts = [
+                page.get_text("text", flags=_TEXT_FLAGS) for page in doc.pages(first, last)
+            ]
+
+        if clean_text:
+            page_texts = [clean_extracted_text(page_text) for page_text in page_texts]
+        if include_page_numbers:
+            token_counts = _count_tokens_with_headers(page_texts, first_page=first + 1)
+            page_texts = [
+                _page_header(page_num) + page_text
+                for page_num, page_text in enumerate(page_texts, start=first + 1)
+            ]
+        else:
+            token_counts = count_tokens_batch(page_texts)
+        yield page_texts, token_counts
 
-        for page_num in range(total_pages):
-            page = doc[page_num]
+    # Shrink once at the end: later windows reuse the fonts and objects
+    # earlier ones loaded into the store
+    _release_mupdf_store()
 
-            # Extract text from page
-            page_text = page.get_text()
 
-            if clean_text:
-                page_text = clean_extracted_text(page_text)
+def _extract_text_from_pdf_sync(
+    pdf_path: str,
+    max_tokens_per_chunk: int = 8000,
+    include_page_numbers: bool = True,
+    clean_text: bool = True,
+    stream: bool = False,
+    output_dir: str | None = None
+) -> dict:
+    """Blocking implementation of extract_text_from_pdf."""
+    try:
+        with _cached_document(pdf_path) as doc:
+            total_pages = len(doc)
 
-            # Add page marker if requested
-            if include_page_numbers:
-                page_header = f"\n--- Page {page_num + 1} ---\n"
-                page_content = page_header + page_text
+        # Streamed chunks go straight to disk rather than into the result
+        out_dir = None
+        if stream:
+            if output_dir:
+                out_dir = Path(output_dir)
             else:
-                page_content = page_text
-
-            # Count tokens for this page
-            page_tokens = count_tokens(page_content)
-
-            # Check if adding this page would exceed token limit
-            if current_tokens + page_tokens > max_tokens_per_chunk and current_chunk:
-                # Save current chunk
-                chunks.append({
-                    "chunk_id": chunk_id,
-                    "text": current_chunk.strip(),
-                    "token_count": current_tokens,
-                    "pages": pages_in_chunk.copy(),
-                    "page_range": f"{pages_in_chunk[0]}-{pages_in_chunk[-1]}" if pages_in_chunk else ""
-                })
-
-                # Start new chunk
-                chunk_id += 1
-                current_chunk = page_content
-                current_tokens = page_tokens
-                pages_in_chunk = [page_num + 1]
+                source_path = Path(pdf_path)
+                out_dir = source_path.parent / f"{source_path.stem}_text_chunks"
+            out_dir.mkdir(exist_ok=True)
+
+        # Pages are extracted, cleaned and counted a window at a time and
+        # packed as they arrive; only pages not yet written out are kept
+        pending_pages: deque[str] = deque()
+        page_token_counts: list[int] = []
+
+        def page_sizes() -> Iterator[tuple[int, int]]:
+            for page_contents, token_counts in _iter_page_windows(
+                pdf_path, total_pages, clean_text, include_page_numbers
+            ):
+                pending_pages.extend(page_contents)
+                page_token_counts.extend(token_counts)
+                yield from zip(token_counts, map(len, page_contents), strict=True)
 
+        chunks = []
+        total_tokens = 0
+        max_chunk_tokens = 0
+        for chunk_id, (start, end) in enumerate(
+            _pack_chunks(page_sizes(), max_tokens_per_chunk), start=1
+        ):
+            chunk_tokens = sum(page_token_counts[start:end])
+            total_tokens += chunk_tokens
+            max_chunk_tokens = max(max_chunk_tokens, chunk_tokens)
+            # Chunks are contiguous from page 0, so the chunk's pages are the
+            # oldest pending ones
+            chunk_text = "".join(pending_pages.popleft() for _ in range(start, end)).strip()
+            if out_dir is None:
+                content_key, content = "text", chunk_text
             else:
-                # Add to current chunk
-                current_chunk += page_content
-                current_tokens += page_tokens
-                pages_in_chunk.append(page_num + 1)
-
-        # Don't forget the last chunk
-        if current_chunk:
+                chunk_file = out_dir / f"chunk_{chunk_id:02d}_pages_{start + 1:03d}-{end:03d}.txt"
+                chunk_file.write_text(chunk_text, encoding="utf-8")
+                content_key, content = "file_path", str(chunk_file)
             chunks.append({
                 "chunk_id": chunk_id,
-                "text": current_chunk.strip(),
-                "token_count": current_tokens,
-                "pages": pages_in_chunk.copy(),
-                "page_range": f"{pages_in_chunk[0]}-{pages_in_chunk[-1]}" if pages_in_chunk else ""
+                content_key: content,
+                "token_count": chunk_tokens,
+                "pages": list(range(start + 1, end + 1)),
+                "page_range": f"{start + 1}-{end}"
             })
 
-        doc.close()
-
-        # Calculate statistics
-        total_tokens = sum(chunk["token_count"] for chunk in chunks)
         avg_tokens_per_chunk = total_tokens / len(chunks) if chunks else 0
 
-        return {
+        result = {
             "status": "success",
-            "source_pdf": str(Path(pdf_path).name),
+            "source_pdf": os.path.basename(pdf_path),
             "total_pages": total_pages,
             "chunks_created": len(chunks),
             "total_tokens": total_tokens,
             "avg_tokens_per_chunk": round(avg_tokens_per_chunk),
-            "max_tokens_per_chunk": max(chunk["token_count"] for chunk in chunks) if chunks else 0,
+            "max_tokens_per_chunk": max_chunk_tokens,
             "chunks": chunks
         }
 
+        if out_dir is not None:
+            manifest_file = out_dir / "manifest.json"
+            result["output_directory"] = str(out_dir)
+            result["manifest_file"] = str(manifest_file)
+            with open(manifest_file, "w", encoding="utf-8") as f:
+                json.dump(result, f, indent=2, ensure_ascii=False)
+
+        return result
+
     except Exception as e:
         return {
             "status": "error",
@@ -360,41 +851,62 @@ async def extract_text_from_pdf(
         }
 
 
-async def extract_pdf_range(
+async def extract_text_from_pdf(
+    pdf_path: str,
+    max_tokens_per_chunk: int = 8000,
+    include_page_numbers: bool = True,
+    clean_text: bool = True,
+    stream: bool = False,
+    output_dir: str | None = None
+) -> dict:
+    """Extract text from PDF in token-aware chunks for LLM consumption.
+
+    With stream=True each chunk's text is written to its own file in
+    output_dir as soon as it is built, instead of being returned inline, and
+    the result (with file paths in place of text) is saved as manifest.json.
+    Pages are read a window at a time, so streaming also keeps memory bounded
+    by a window of pages plus the chunk being written.
+    """
+    return await asyncio.to_thread(
+        _extract_text_from_pdf_sync,
+        pdf_path, max_tokens_per_chunk, include_page_numbers, clean_text,
+        stream, output_dir
+    )
+
+
+def _extract_pdf_range_sync(
     pdf_path: str,
     start_page: int,
     end_page: int,
     output_path: str | None = None
 ) -> dict:
-    """Extract a specific page range as a new PDF file."""
+    """Blocking implementation of extract_pdf_range."""
     try:
-        doc = fitz.open(pdf_path)
-        total_pages = len(doc)
+        with _cached_document(pdf_path) as doc:
+            total_pages = len(doc)
 
-        # Validate page range
-        if start_page < 1 or end_page > total_pages or start_page > end_page:
-            doc.close()
-            return {
-                "status": "error",
-                "error": f"Invalid page range {start_page}-{end_page}. PDF has {total_pages} pages."
-            }
+            # Validate page range
+            if start_page < 1 or end_page > total_pages or start_page > end_page:
+                return {
+                    "status": "error",
+                    "error": f"Invalid page range {start_page}-{end_page}. PDF has {total_pages} pages."
+                }
 
-        # Determine output path
-        source_path = Path(pdf_path)
-        if not output_path:
-            output_path = source_path.parent / f"{source_path.stem}_pages_{start_page}-{end_page}.pdf"
-        else:
-            output_path = Path(output_path)
+            # Determine output path
+            source_path = Path(pdf_path)
+            if not output_path:
+                output_path = source_path.parent / f"{source_path.stem}_pages_{start_page}-{end_page}.pdf"
+            else:
+                output_path = Path(output_path)
 
-        # Create new PDF with specified pages
-        new_doc = fitz.open()
+            # Create new PDF with specified pages
+            new_doc = fitz.open()
 
-        for page_num in range(start_page - 1, end_page):  # Convert to 0-indexed
-            new_doc.insert_pdf(doc, from_page=page_num, to_page=page_num)
+            new_doc.insert_pdf(doc, from_page=start_page - 1, to_page=end_page - 1)  # 0-indexed
 
-        new_doc.save(output_path)
-        new_doc.close()
-        doc.close()
+            new_doc.save(output_path, **_SAVE_OPTIONS)
+            new_doc.close()
+        _release_mupdf_store()
 
         return {
             "status": "success",
@@ -409,3 +921,13 @@ async def extract_pdf_range(
             "status": "error",
             "error": f"Failed to extract page range: {e!s}"
         }
+
+
+async def extract_pdf_range(
+    pdf_path: str,
+    start_page: int,
+    end_page: int,
+    output_path: str | None = None
+) -> dict:
+    """Extract a specific page range as a new PDF file."""
+    return await asyncio.to_thread(_extract_pdf_range_sync, pdf_path, start_page, end_page, output_path)
@@ -7,11 +7,12 @@ into digestible chunks that Claude can process effectively. Features structured
 configuration management, and robust error handling.
 """
 
+import os
 import sys
 from pathlib import Path
 
 from fastmcp import FastMCP
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
 
 from .config import config
 from .logging_setup import get_logger, setup_logging
@@ -40,8 +41,19 @@ class PDFInfo(BaseModel):
     creator: str | None = None
 
 
+def _check_parent_exists(v: str | None) -> str | None:
+    """Reject output paths whose parent directory doesn't exist."""
+    if v is not None:
+        path = Path(v)
+        if not path.parent.exists():
+            raise ValueError(f"Parent directory does not exist: {path.parent}")
+    return v
+
+
 class SplitOptions(BaseModel):
     """Options for PDF splitting operations with enhanced validation."""
+    model_config = ConfigDict(frozen=True)
+
     pages_per_chunk: int = Field(
         default=20,
         gt=0,
@@ -52,18 +64,13 @@ class SplitOptions(BaseModel):
     preserve_bookmarks: bool = Field(default=True, description="Keep PDF bookmarks")
     prefix: str = Field(default="chunk", description="Filename prefix for chunks")
 
-    @field_validator("output_dir")
-    @classmethod
-    def validate_output_dir(cls, v):
-        if v is not None:
-            path = Path(v)
-            if not path.parent.exists():
-                raise ValueError(f"Parent directory does not exist: {path.parent}")
-        return v
+    _check_output_dir = field_validator("output_dir")(_check_parent_exists)
 
 
 class ExtractionOptions(BaseModel):
     """Options for text extraction with configuration integration."""
+    model_config = ConfigDict(frozen=True)
+
     max_tokens_per_chunk: int = Field(
         default=8000,
         gt=100,
@@ -73,6 +80,25 @@ class ExtractionOptions(BaseModel):
     include_page_numbers: bool = Field(default=True)
     clean_text: bool = Field(default=True, description="Remove extra whitespace")
     preserve_formatting: bool = Field(default=False, description="Keep original formatting")
+    stream: bool = Field(default=False, description="Write chunk text to files instead of returning it")
+    output_dir: str | None = Field(default=None, description="Output directory for streamed chunks")
+
+    _check_output_dir = field_validator("output_dir")(_check_parent_exists)
+
+
+# Options are validated on every tool call; build the validators once
+_SPLIT_ADAPTER = TypeAdapter(SplitOptions)
+_EXTRACTION_ADAPTER = TypeAdapter(ExtractionOptions)
+
+
+def validate_split(data: dict) -> SplitOptions:
+    """Validate split tool arguments, raising ValidationError if invalid."""
+    return _SPLIT_ADAPTER.validate_python(data)
+
+
+def validate_extraction(data: dict) -> ExtractionOptions:
+    """Validate text extraction tool arguments, raising ValidationError if invalid."""
+    return _EXTRACTION_ADAPTER.validate_python(data)
 
 
 @app.tool()
@@ -90,6 +116,14 @@ async def prometheus_info(pdf_path: str) -> dict:
     """
     try:
         logger.info("PDF info requested", pdf_path=pdf_path)
+
+        # Wrong paths and empty downloads are the common mistakes; report them
+        # without handing the file to MuPDF
+        if not os.path.isfile(pdf_path):
+            return {"status": "error", "error": f"Failed to read PDF: file not found: {pdf_path}"}
+        if os.path.getsize(pdf_path) == 0:
+            return {"status": "error", "error": f"Failed to read PDF: file is empty: {pdf_path}"}
+
         result = await get_pdf_info(pdf_path)
 
         if result["status"] == "success":
@@ -132,11 +166,11 @@ async def prometheus_split(
     """
     # Validate options with enhanced error messages
     try:
-        SplitOptions(
-            pages_per_chunk=pages_per_chunk,
-            output_dir=output_dir,
-            prefix=prefix
-        )
+        validate_split({
+            "pages_per_chunk": pages_per_chunk,
+            "output_dir": output_dir,
+            "prefix": prefix
+        })
     except Exception as e:
         logger.warning("Invalid split options", error=str(e))
         return {"status": "error", "error": f"Invalid options: {e!s}"}
@@ -165,7 +199,9 @@ async def prometheus_extract_text(
     pdf_path: str,
     max_tokens_per_chunk: int = 8000,
     include_page_numbers: bool = True,
-    clean_text: bool = True
+    clean_text: bool = True,
+    stream: bool = False,
+    output_dir: str | None = None
 ) -> dict:
     """Extract text from PDF in intelligent, token-aware chunks optimized for LLMs.
 
@@ -178,17 +214,23 @@ async def prometheus_extract_text(
         max_tokens_per_chunk: Maximum tokens per text chunk (100-{config.max_token_limit})
         include_page_numbers: Include page markers for reference tracking
         clean_text: Apply advanced text cleaning for better readability
+        stream: Write each chunk to a text file (plus manifest.json) instead of
+            returning the text inline; keeps large documents out of the response
+        output_dir: Directory for streamed chunks (defaults to same dir as source
+            with "_text_chunks" suffix)
 
     Returns:
         Dictionary with extracted text chunks, token statistics, and processing metadata
     """
     # Validate options with detailed error messages
     try:
-        ExtractionOptions(
-            max_tokens_per_chunk=max_tokens_per_chunk,
-            include_page_numbers=include_page_numbers,
-            clean_text=clean_text
-        )
+        validate_extraction({
+            "max_tokens_per_chunk": max_tokens_per_chunk,
+            "include_page_numbers": include_page_numbers,
+            "clean_text": clean_text,
+            "stream": stream,
+            "output_dir": output_dir
+        })
     except Exception as e:
         logger.warning("Invalid extraction options", error=str(e))
         return {"status": "error", "error": f"Invalid options: {e!s}"}
@@ -197,11 +239,13 @@ async def prometheus_extract_text(
         "PDF text extraction requested",
         pdf_path=pdf_path,
         max_tokens=max_tokens_per_chunk,
-        clean_text=clean_text
+        clean_text=clean_text,
+        stream=stream
     )
 
     result = await extract_text_from_pdf(
-        pdf_path, max_tokens_per_chunk, include_page_numbers, clean_text
+        pdf_path, max_tokens_per_chunk, include_page_numbers, clean_text,
+        stream, output_dir
     )
 
     if result["status"] == "success":
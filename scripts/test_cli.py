@@ -6,40 +6,98 @@ Standalone CLI for testing PDF processing functionality before MCP integration.
 """
 
 import asyncio
+import fnmatch
 import json
+import os
+from itertools import islice
 from pathlib import Path
 from typing import Optional
 
 import typer
+# Table/Panel are imported by the commands that draw them, so e.g. `demo`
+# doesn't pay for them at startup
 from rich.console import Console
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.table import Table
 
 # Import our utility functions directly
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from prometheus.logging_setup import setup_logging
 from prometheus.pdf_utils import (
+    PDFError,
     get_pdf_info,
     split_pdf,
     extract_text_from_pdf,
     extract_pdf_range,
 )
 
+# Importing pdf_utils doesn't configure logging (only the server does), so
+# apply PROMETHEUS_LOG_LEVEL / PROMETHEUS_LOG_FORMAT here
+setup_logging()
+
+try:
+    import uvloop
+except ImportError:  # optional: faster event loop when installed
+    uvloop = None
+
+try:
+    import orjson
+except ImportError:  # optional: faster JSON output when installed
+    orjson = None
+
 console = Console()
+
+# Collapses line breaks and tabs so text previews stay on one table row
+_NL_TABLE = str.maketrans({"\n": " ", "\r": " ", "\t": " "})
+
 app = typer.Typer(
     name="prometheus-cli",
     help="Test CLI for Prometheus PDF liberation tools",
     rich_markup_mode="rich"
 )
 
+# One event loop shared by every command run in this process; the loop is
+# only created on first use and closed when the CLI exits.
+_runner = asyncio.Runner(loop_factory=uvloop.new_event_loop if uvloop else None)
+
+
+def _run(coro):
+    """Run a coroutine on the CLI's shared event loop (uvloop if available)."""
+    return _runner.run(coro)
+
+
+def _write_json(path: Path, obj) -> None:
+    """Serialize obj as indented UTF-8 JSON to path (via orjson if available)."""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        path.write_text(json.dumps(obj, indent=2, ensure_ascii=False), encoding="utf-8")
+
+
+def _first_match(pattern: str) -> str | None:
+    """Return the first path matching a glob pattern, stopping at the first hit."""
+    base, name_pattern = os.path.split(pattern)
+    if not any(c in name_pattern for c in "*?["):
+        return pattern if os.path.exists(pattern) else None
+    try:
+        with os.scandir(base or ".") as entries:
+            for entry in entries:
+                # Like glob, wildcards don't match hidden files
+                if entry.name.startswith(".") and not name_pattern.startswith("."):
+                    continue
+                if fnmatch.fnmatch(entry.name, name_pattern):
+                    return entry.path
+    except OSError:
+        pass
+    return None
+
 
 @app.command()
 def info(
     pdf_path: str = typer.Argument(..., help="Path to PDF file"),
 ):
     """Get information about a PDF file."""
+    from rich.table import Table
     
     async def run_info():
         result = await get_pdf_info(pdf_path)
@@ -56,7 +114,7 @@ def info(
         table.add_column("Property", style="cyan")
         table.add_column("Value", style="white")
         
-        table.add_row("File", Path(pdf_path).name)
+        table.add_row("File", os.path.basename(pdf_path))
         table.add_row("Total Pages", str(info_data["total_pages"]))
         table.add_row("File Size", f"{info_data['file_size_mb']} MB")
         table.add_row("Has Bookmarks", "Yes" if info_data["has_bookmarks"] else "No")
@@ -83,7 +141,7 @@ def info(
         
         console.print(est_table)
     
-    asyncio.run(run_info())
+    _run(run_info())
 
 
 @app.command()
@@ -94,6 +152,8 @@ def split(
     prefix: str = typer.Option("chunk", "--prefix", help="Filename prefix"),
 ):
     """Split PDF into smaller chunks."""
+    from rich.panel import Panel
+    from rich.table import Table
     
     async def run_split():
         with console.status("[green]Splitting PDF...") as status:
@@ -111,7 +171,7 @@ def split(
         # Success message
         panel = Panel(
             f"[green]✓[/green] {result['message']}\n\n"
-            f"[cyan]Source:[/cyan] {Path(result['source_pdf']).name}\n"
+            f"[cyan]Source:[/cyan] {os.path.basename(result['source_pdf'])}\n"
             f"[cyan]Output:[/cyan] {result['output_directory']}\n"
             f"[cyan]Chunks:[/cyan] {result['chunks_created']}",
             title="Split Complete",
@@ -126,11 +186,11 @@ def split(
             table.add_column("Pages", style="white")
             table.add_column("File", style="yellow")
             
-            for chunk in result["chunks"][:10]:  # Show first 10
+            for chunk in islice(result["chunks"], 10):  # Show first 10
                 table.add_row(
                     str(chunk["chunk_id"]),
                     chunk["pages"],
-                    Path(chunk["file_path"]).name
+                    os.path.basename(chunk["file_path"])
                 )
             
             if len(result["chunks"]) > 10:
@@ -138,7 +198,7 @@ def split(
             
             console.print(table)
     
-    asyncio.run(run_split())
+    _run(run_split())
 
 
 @app.command()
@@ -150,6 +210,8 @@ def extract(
     page_numbers: bool = typer.Option(True, "--page-numbers/--no-page-numbers", help="Include page numbers"),
 ):
     """Extract text from PDF in token-aware chunks."""
+    from rich.panel import Panel
+    from rich.table import Table
     
     async def run_extract():
         with console.status("[green]Extracting text...") as status:
@@ -185,13 +247,15 @@ def extract(
             table.add_column("Tokens", style="yellow")
             table.add_column("Preview", style="dim")
             
-            for chunk in result["chunks"][:5]:  # Show first 5
-                preview = chunk["text"][:100] + "..." if len(chunk["text"]) > 100 else chunk["text"]
+            for chunk in islice(result["chunks"], 5):  # Show first 5
+                preview = chunk["text"][:100].translate(_NL_TABLE)
+                if len(chunk["text"]) > 100:
+                    preview += "..."
                 table.add_row(
                     str(chunk["chunk_id"]),
                     chunk["page_range"],
                     f"{chunk['token_count']:,}",
-                    preview.replace('\n', ' ')
+                    preview
                 )
             
             if len(result["chunks"]) > 5:
@@ -202,11 +266,10 @@ def extract(
         # Save to file if requested
         if output_file:
             output_path = Path(output_file)
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(result, f, indent=2, ensure_ascii=False)
+            await asyncio.to_thread(_write_json, output_path, result)
             console.print(f"[green]Saved to:[/green] {output_path}")
     
-    asyncio.run(run_extract())
+    _run(run_extract())
 
 
 @app.command()
@@ -217,6 +280,7 @@ def extract_range(
     output_path: Optional[str] = typer.Option(None, "--output", "-o", help="Output PDF path"),
 ):
     """Extract specific page range as new PDF."""
+    from rich.panel import Panel
     
     async def run_extract_range():
         with console.status(f"[green]Extracting pages {start_page}-{end_page}..."):
@@ -233,7 +297,7 @@ def extract_range(
         
         panel = Panel(
             f"[green]✓[/green] Pages extracted successfully\n\n"
-            f"[cyan]Source:[/cyan] {Path(result['source_pdf']).name}\n"
+            f"[cyan]Source:[/cyan] {os.path.basename(result['source_pdf'])}\n"
             f"[cyan]Pages:[/cyan] {result['extracted_pages']} ({result['page_count']} pages)\n"
             f"[cyan]Output:[/cyan] {result['output_file']}",
             title="Page Extraction Complete",
@@ -241,7 +305,7 @@ def extract_range(
         )
         console.print(panel)
     
-    asyncio.run(run_extract_range())
+    _run(run_extract_range())
 
 
 @app.command()
@@ -258,10 +322,8 @@ def demo(
         ]
         
         for pattern in common_paths:
-            from glob import glob
-            matches = glob(pattern)
-            if matches:
-                pdf_path = matches[0]
+            pdf_path = _first_match(pattern)
+            if pdf_path:
                 break
         
         if not pdf_path:
@@ -269,13 +331,21 @@ def demo(
             console.print("Usage: python test_cli.py demo /path/to/file.pdf")
             return
     
-    console.print(f"[cyan]Running demo with:[/cyan] {Path(pdf_path).name}")
+    console.print(f"[cyan]Running demo with:[/cyan] {os.path.basename(pdf_path)}")
     console.print()
     
     async def run_demo():
+        # The three operations are independent; run them concurrently and
+        # report in order once they're all done
+        with console.status("[green]Running demo..."):
+            info_result, split_result, extract_result = await asyncio.gather(
+                get_pdf_info(pdf_path),
+                split_pdf(pdf_path, pages_per_chunk=5),
+                extract_text_from_pdf(pdf_path, max_tokens_per_chunk=2000),
+            )
+
         # Run info command
         console.rule("PDF Information")
-        info_result = await get_pdf_info(pdf_path)
         # Display basic info
         if info_result["status"] == "success":
             console.print(f"Pages: {info_result['pdf_info']['total_pages']}")
@@ -285,7 +355,6 @@ def demo(
         
         # Run a small split test
         console.rule("Split Test (5 pages per chunk)")
-        split_result = await split_pdf(pdf_path, pages_per_chunk=5)
         if split_result["status"] == "success":
             console.print(f"Created {split_result['chunks_created']} chunks")
         
@@ -293,12 +362,63 @@ def demo(
         
         # Extract a small sample
         console.rule("Text Extraction Test")
-        extract_result = await extract_text_from_pdf(pdf_path, max_tokens_per_chunk=2000)
         if extract_result["status"] == "success":
             console.print(f"Extracted {extract_result['total_tokens']:,} total tokens")
     
-    asyncio.run(run_demo())
+    _run(run_demo())
+
+
+@app.command()
+def demo_batch(
+    pdf_paths: list[str] = typer.Argument(..., help="Paths to PDF files"),
+):
+    """Run the demo over several PDFs concurrently and summarize the results."""
+    from rich.markup import escape
+    from rich.table import Table
+
+    async def run_demo_batch():
+        # Cap how many documents are open at once so MuPDF memory stays bounded
+        semaphore = asyncio.Semaphore(8)
+
+        async def run_one(path):
+            async with semaphore:
+                try:
+                    return await asyncio.gather(
+                        get_pdf_info(path),
+                        split_pdf(path, pages_per_chunk=5),
+                        extract_text_from_pdf(path, max_tokens_per_chunk=2000),
+                    )
+                except PDFError as e:
+                    # One bad file shouldn't abort the rest of the batch
+                    error = {"status": "error", "error": str(e)}
+                    return error, error, error
+
+        with console.status(f"[green]Running demo on {len(pdf_paths)} PDFs..."):
+            results = await asyncio.gather(*(run_one(path) for path in pdf_paths))
+
+        table = Table(title="Demo Results")
+        table.add_column("File", style="cyan")
+        table.add_column("Pages", style="white")
+        table.add_column("Split Chunks", style="white")
+        table.add_column("Tokens", style="yellow")
+
+        for path, (info_result, split_result, extract_result) in zip(pdf_paths, results, strict=True):
+            name = escape(os.path.basename(path))
+            if info_result["status"] == "error":
+                table.add_row(name, f"[red]{escape(info_result['error'])}[/red]", "", "")
+                continue
+            table.add_row(
+                name,
+                str(info_result["pdf_info"]["total_pages"]),
+                str(split_result["chunks_created"]) if split_result["status"] == "success" else "[red]failed[/red]",
+                f"{extract_result['total_tokens']:,}" if extract_result["status"] == "success" else "[red]failed[/red]",
+            )
+
+        console.print(table)
+
+    _run(run_demo_batch())
 
 
 if __name__ == "__main__":
-    app()
\ No newline at end of file
+    with _runner:
+        app()
\ No newline at end of file
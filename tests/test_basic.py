@@ -3,13 +3,44 @@ Basic tests for Prometheus PDF processing tools.
 """
 
 import json
+import os
+import re
 import tempfile
+import time
 from pathlib import Path
 from unittest.mock import Mock, patch
 
+import fitz
 import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+from pydantic import ValidationError
 
-from prometheus.server import count_tokens, clean_extracted_text
+from prometheus import pdf_utils
+from prometheus.pdf_utils import (
+    _pack_chunks,
+    clean_extracted_text,
+    count_tokens,
+    count_tokens_batch,
+    extract_text_from_pdf,
+    get_pdf_info,
+    split_pdf,
+)
+from prometheus.server import (
+    prometheus_info,
+    prometheus_split,
+    validate_extraction,
+    validate_split,
+)
+
+
+def _make_pdf(path, pages):
+    """Write a PDF whose pages read "Page 1", "Page 2", ..."""
+    doc = fitz.open()
+    for i in range(pages):
+        doc.new_page().insert_text((72, 72), f"Page {i + 1}")
+    doc.save(path)
+    doc.close()
 
 
 def test_count_tokens():
@@ -19,6 +50,7 @@ def test_count_tokens():
     
     # Empty text
     assert count_tokens("") == 0
+    assert count_tokens(" \n\t ") == 0
     
     # Longer text should have more tokens
     short_text = "hello"
@@ -26,6 +58,114 @@ def test_count_tokens():
     assert count_tokens(long_text) > count_tokens(short_text)
 
 
+def test_count_tokens_cached():
+    """Test that cached token counts match fresh counts, including long texts."""
+    long_text = "The quick brown fox jumps over the lazy dog. " * 200
+    first = count_tokens(long_text)
+    assert count_tokens(long_text) == first
+    assert count_tokens_batch([long_text, "hello world"]) == [first, count_tokens("hello world")]
+
+
+def test_count_tokens_batch_matches_single():
+    """Test that batch counting agrees with per-string counting on fresh texts."""
+    texts = [
+        "Batch equivalence check: alpha beta gamma.",
+        "",
+        " \n\t ",
+        "Duplicated text in one batch",
+        "Duplicated text in one batch",
+        "Special token literal <|endoftext|> stays ordinary text",
+        "Unicode \u2022 caf\u00e9 \u65e5\u672c\u8a9e \U0001f525" * 50,
+    ]
+    pdf_utils._token_cache.clear()
+    batch = count_tokens_batch(texts)
+    pdf_utils._token_cache.clear()
+    assert batch == [count_tokens(text) for text in texts]
+
+
+# cl100k_base's pre-tokenizer; every piece it yields is at least one token
+CL100K_PAT_STR = (
+    r"""'(?i:[sdmt]|ll|ve|re)|[^\r\n\p{L}\p{N}]?+\p{L}++|\p{N}{1,3}+| ?[^\s\p{L}\p{N}]++[\r\n]*+|"""
+    r"""\s++$|\s*[\r\n]|\s+(?!\S)|\s"""
+)
+
+
+class PieceEncoder:
+    """Stand-in encoder with one token per cl100k pre-tokenizer piece."""
+
+    def __init__(self):
+        import regex
+
+        self.pattern = regex.compile(CL100K_PAT_STR)
+
+    def encode_ordinary(self, text):
+        return self.pattern.findall(text)
+
+    def encode_ordinary_batch(self, texts, num_threads=8):
+        return [self.encode_ordinary(text) for text in texts]
+
+
+@pytest.mark.parametrize("first_page", [1, 64, 1000])
+def test_count_tokens_with_headers(monkeypatch, first_page):
+    """Test that header arithmetic matches encoding header and body together."""
+    encoder = PieceEncoder()
+    bodies = [
+        "\nstarts with a newline",
+        "\r\nstarts with CRLF",
+        " starts with a space",
+        ".starts with punctuation",
+        "1 starts with a digit",
+        "Hello",
+        "",
+        "  ",
+        "\n",
+        "\r\n\r\n",
+        " \t\n",
+    ]
+    monkeypatch.setattr(pdf_utils, "_get_encoder", lambda: encoder)
+    pdf_utils._page_header_base_tokens.cache_clear()
+    pdf_utils._token_cache.clear()
+    try:
+        counts = pdf_utils._count_tokens_with_headers(bodies, first_page=first_page)
+    finally:
+        pdf_utils._page_header_base_tokens.cache_clear()
+        pdf_utils._token_cache.clear()
+
+    assert counts == [
+        len(encoder.encode_ordinary(pdf_utils._page_header(n) + body))
+        for n, body in enumerate(bodies, start=first_page)
+    ]
+
+
+@pytest.mark.parametrize("env, configured, expected", [
+    ({"TIKTOKEN_CACHE_DIR": ""}, "ours", ""),
+    ({"TIKTOKEN_CACHE_DIR": "theirs"}, "ours", "theirs"),
+    ({"DATA_GYM_CACHE_DIR": "gym"}, "ours", None),
+    ({}, "", ""),
+    ({}, "ours", "ours"),
+])
+def test_tiktoken_cache_dir(tmp_path, monkeypatch, env, configured, expected):
+    """Test that tiktoken's own cache variables win and empty disables caching."""
+    import tiktoken
+
+    monkeypatch.delenv("TIKTOKEN_CACHE_DIR", raising=False)
+    monkeypatch.delenv("DATA_GYM_CACHE_DIR", raising=False)
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+    cache_dir = str(tmp_path / configured) if configured else ""
+    monkeypatch.setattr(
+        pdf_utils, "config", pdf_utils.config.model_copy(update={"tiktoken_cache_dir": cache_dir})
+    )
+    monkeypatch.setattr(tiktoken, "get_encoding", lambda name: name)
+    monkeypatch.setattr(pdf_utils, "_get_encoder", pdf_utils._get_encoder.__wrapped__)
+
+    pdf_utils._get_encoder()
+    if expected == "ours":
+        expected = cache_dir
+        assert (tmp_path / "ours").is_dir()
+    assert os.environ.get("TIKTOKEN_CACHE_DIR") == expected
+
+
 def test_clean_extracted_text():
     """Test text cleaning functionality."""
     # Test excessive whitespace removal
@@ -45,49 +185,212 @@ def test_clean_extracted_text():
     cleaned_numbered = clean_extracted_text(numbered_text)
     assert "\n42\n" not in cleaned_numbered
 
+    # Already-clean text passes through unchanged apart from stripping
+    clean_text = "First line\nSecond line. Third sentence\n\nNew paragraph"
+    assert clean_extracted_text(f"  {clean_text}\n") == clean_text
+
+
+def _reference_clean(text):
+    """The cleaner as a plain sequence of re.sub passes, for comparison."""
+    text = re.sub(r'\n\s*\n\s*\n+', '\n\n', text)
+    text = re.sub(r'[ \t]+', ' ', text)
+    text = re.sub(r'\n\d+\n', '\n', text)
+    text = re.sub(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\xff]', '', text)
+    text = re.sub(r'\u2022\s*', '\u2022 ', text)
+    text = re.sub(r'([.!?])\s*([A-Z])', r'\1 \2', text)
+    return text.strip()
+
+
+@given(st.text(alphabet=" \t\n\r\x0b\x0c\x01\x7f\xa0\u2022.!?aZ09", max_size=200))
+def test_clean_extracted_text_matches_reference(text):
+    """Test that the fused cleaning passes agree with the sequential ones."""
+    assert clean_extracted_text(text) == _reference_clean(text)
+
+
+@settings(deadline=200)
+@given(st.text(alphabet=" \n\t0123456789abc.A", max_size=20_000))
+def test_clean_extracted_text_properties(text):
+    """Test output invariants; the deadline catches pathological slowdowns."""
+    cleaned = clean_extracted_text(text)
+    assert cleaned == cleaned.strip()
+    assert "\t" not in cleaned
+    assert "  " not in cleaned
+    assert "\n\n\n" not in cleaned
+
+
+@pytest.mark.parametrize("make", [
+    lambda n: " " * n + "x",
+    lambda n: "a" + "\n" * n + "b",
+    lambda n: "a" + " \n" * (n // 2) + "b",
+    lambda n: "\n1" * (n // 2),
+    lambda n: ".A" * (n // 2),
+])
+def test_clean_extracted_text_scales_linearly(make):
+    """Test that quadrupling the input doesn't come close to 16x the time."""
+    def best_time(n):
+        text = make(n)
+        timings = []
+        for _ in range(5):
+            start = time.perf_counter()
+            clean_extracted_text(text)
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+
+    small, large = best_time(50_000), best_time(200_000)
+    # Linear is ~4x; quadratic would be ~16x
+    assert large < max(small, 1e-4) * 10
+
+
+def test_pack_chunks():
+    """Test greedy page packing by token budget."""
+    def pack(token_counts, text_lengths, max_tokens):
+        return list(_pack_chunks(zip(token_counts, text_lengths, strict=True), max_tokens))
+
+    assert pack([3, 3, 3, 10, 1], [1] * 5, 6) == [(0, 2), (2, 3), (3, 4), (4, 5)]
+    # Empty pages never close a chunk on their own
+    assert pack([0, 0, 9, 1], [0, 0, 5, 5], 5) == [(0, 3), (3, 4)]
+    assert pack([0, 0], [0, 0], 5) == []
+
 
 @pytest.mark.asyncio
-async def test_prometheus_info_missing_file():
-    """Test info tool with non-existent file."""
-    from prometheus.server import prometheus_info
-    
-    result = await prometheus_info("/nonexistent/file.pdf")
+async def test_prometheus_info_missing_file(tmp_path):
+    """Test info tool with non-existent and zero-byte files."""
+    result = await prometheus_info(str(tmp_path / "missing.pdf"))
+    assert result["status"] == "error"
+    assert "Failed to read PDF" in result["error"]
+
+    empty = tmp_path / "empty.pdf"
+    empty.write_bytes(b"")
+    result = await prometheus_info(str(empty))
     assert result["status"] == "error"
     assert "Failed to read PDF" in result["error"]
 
 
 def test_validation_models():
     """Test Pydantic models validation."""
-    from prometheus.server import SplitOptions, ExtractionOptions
-    
     # Test valid SplitOptions
-    options = SplitOptions(pages_per_chunk=20)
+    options = validate_split({"pages_per_chunk": 20})
     assert options.pages_per_chunk == 20
     
     # Test invalid pages_per_chunk (too high)
-    with pytest.raises(ValueError):
-        SplitOptions(pages_per_chunk=500)
+    with pytest.raises(ValidationError):
+        validate_split({"pages_per_chunk": 500})
     
     # Test invalid pages_per_chunk (too low)
-    with pytest.raises(ValueError):
-        SplitOptions(pages_per_chunk=0)
+    with pytest.raises(ValidationError):
+        validate_split({"pages_per_chunk": 0})
     
     # Test valid ExtractionOptions
-    extract_opts = ExtractionOptions(max_tokens_per_chunk=4000)
+    extract_opts = validate_extraction({"max_tokens_per_chunk": 4000})
     assert extract_opts.max_tokens_per_chunk == 4000
     
     # Test invalid token limit (too high)
-    with pytest.raises(ValueError):
-        ExtractionOptions(max_tokens_per_chunk=50000)
+    with pytest.raises(ValidationError):
+        validate_extraction({"max_tokens_per_chunk": 50000})
+
+    # Validated options are immutable
+    with pytest.raises(ValidationError):
+        options.pages_per_chunk = 10
+
+
+@pytest.mark.asyncio
+async def test_split_pdf_chunks(tmp_path):
+    """Test splitting a generated PDF into page-range chunks."""
+    source = tmp_path / "source.pdf"
+    _make_pdf(source, 5)
+
+    result = await split_pdf(str(source), pages_per_chunk=2, output_dir=str(tmp_path / "out"))
+    assert result["status"] == "success"
+    assert [chunk["page_count"] for chunk in result["chunks"]] == [2, 2, 1]
+    for chunk in result["chunks"]:
+        with fitz.open(chunk["file_path"]) as chunk_doc:
+            assert len(chunk_doc) == chunk["page_count"]
+
+
+@pytest.mark.asyncio
+async def test_split_pdf_process_pool(tmp_path, monkeypatch):
+    """Test that the multi-process split writes the same chunks as the serial one."""
+    source = tmp_path / "source.pdf"
+    _make_pdf(source, 7)
+
+    serial = await split_pdf(str(source), pages_per_chunk=2, output_dir=str(tmp_path / "serial"))
+
+    # Force the pool path regardless of file size and core count
+    monkeypatch.setattr(pdf_utils, "_PARALLEL_SPLIT_MIN_MB", 0)
+    monkeypatch.setattr(pdf_utils, "_MAX_SPLIT_WORKERS", 2)
+    monkeypatch.setattr(pdf_utils, "_split_pool", None)
+    try:
+        parallel = await split_pdf(str(source), pages_per_chunk=2, output_dir=str(tmp_path / "parallel"))
+        assert pdf_utils._split_pool is not None
+        # Relative paths are resolved against our cwd, not the workers'
+        monkeypatch.chdir(tmp_path)
+        relative = await split_pdf("source.pdf", pages_per_chunk=2, output_dir="relative")
+    finally:
+        if pdf_utils._split_pool is not None:
+            pdf_utils._split_pool.shutdown()
+
+    for result in (parallel, relative):
+        assert result["status"] == "success", result.get("error")
+        assert result["chunks_created"] == serial["chunks_created"] == 4
+        for serial_chunk, chunk in zip(serial["chunks"], result["chunks"], strict=True):
+            assert chunk["pages"] == serial_chunk["pages"]
+            with fitz.open(serial_chunk["file_path"]) as expected, fitz.open(chunk["file_path"]) as actual:
+                assert [page.get_text() for page in actual] == [page.get_text() for page in expected]
+
+
+@pytest.mark.asyncio
+async def test_extract_text_streaming(tmp_path):
+    """Test that streamed extraction writes chunk files and a manifest."""
+    source = tmp_path / "source.pdf"
+    _make_pdf(source, 3)
+
+    inline = await extract_text_from_pdf(str(source), max_tokens_per_chunk=10)
+    out_dir = tmp_path / "text"
+    streamed = await extract_text_from_pdf(
+        str(source), max_tokens_per_chunk=10, stream=True, output_dir=str(out_dir)
+    )
+    assert streamed["status"] == "success"
+    assert streamed["chunks_created"] == inline["chunks_created"]
+    for inline_chunk, chunk in zip(inline["chunks"], streamed["chunks"], strict=True):
+        assert "text" not in chunk
+        assert Path(chunk["file_path"]).read_text(encoding="utf-8") == inline_chunk["text"]
+    manifest = json.loads((out_dir / "manifest.json").read_text(encoding="utf-8"))
+    assert manifest["chunks"] == streamed["chunks"]
+
+
+@pytest.mark.asyncio
+async def test_extract_text_unmapped_glyphs(tmp_path):
+    """Test that glyphs without a Unicode mapping don't come out as U+FFFD."""
+    source = tmp_path / "source.pdf"
+    doc = fitz.open()
+    doc.new_page().insert_text((72, 72), "out\ttext")
+    doc.save(source)
+    doc.close()
+
+    result = await extract_text_from_pdf(str(source), include_page_numbers=False)
+    assert result["chunks"][0]["text"] == "out text"
+
+
+@pytest.mark.asyncio
+async def test_get_pdf_info_cache_invalidation(tmp_path):
+    """Test that cached PDF info is refreshed when the file changes."""
+    source = tmp_path / "source.pdf"
+    _make_pdf(source, 1)
+    first = await get_pdf_info(str(source))
+    assert first["pdf_info"]["total_pages"] == 1
+    assert await get_pdf_info(str(source)) == first
+
+    _make_pdf(source, 2)
+    second = await get_pdf_info(str(source))
+    assert second["pdf_info"]["total_pages"] == 2
 
 
 # Integration test that requires actual PDF
 @pytest.mark.integration
+@pytest.mark.xdist_group(name="integration")
 @pytest.mark.asyncio
 async def test_full_workflow_with_sample_pdf():
     """Integration test with a real PDF file (if available)."""
-    from prometheus.server import prometheus_info, prometheus_split
-    
     # Look for Meeker PDF in common location
     sample_pdf = "/Users/terry/Downloads/Trends_Artificial_Intelligence.pdf"
     